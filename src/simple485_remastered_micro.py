@@ -6,6 +6,7 @@
 # ------------------------------------------------------------------------------
 
 import machine
+import micropython
 import ubinascii
 import utime
 from micropython import const  # MicroPython specific optimization for compile time constants
@@ -29,6 +30,19 @@ FIRST_NODE_ADDRESS = const(0)
 MASTER_ADDRESS = const(FIRST_NODE_ADDRESS)
 BROADCAST_ADDRESS = const(255)
 LAST_NODE_ADDRESS = const(BROADCAST_ADDRESS - 1)
+# 3x LF + SOH + DST + SRC + TID + LEN + STX before the payload, ETX + CRC + EOT + 2x LF after it
+FRAME_OVERHEAD_LEN = const(14)
+# Number of RX payload buffers rotated through when zero-copy payloads are enabled
+RX_BUFFER_POOL_SIZE = const(4)
+
+
+# Integer forms of the control sequences, used wherever a single byte is compared or written
+SOH = const(0x01)
+STX = const(0x02)
+ETX = const(0x03)
+EOT = const(0x04)
+LF = const(0x0A)
+NULL = const(0x00)
 
 
 class ControlSequence:
@@ -40,6 +54,10 @@ class ControlSequence:
     NULL = b"\x00"
 
 
+# Line-settling LF padding followed by SOH, copied into every outgoing frame as-is
+FRAME_START = ControlSequence.LF * 3 + ControlSequence.SOH
+
+
 class ReceiverState:
     IDLE = const(0)
     SOH_RECEIVED = const(1)
@@ -52,12 +70,19 @@ class ReceiverState:
     CRC_OK = const(8)
 
 
+# Each payload byte is sent as two bytes: the data nibble followed by its complement.
+# The tables are built once at import so encoding and validation are single indexed loads.
+HI_NIBBLE_ENCODE = bytes((b & 240) | (~(b >> 4) & 15) for b in range(256))
+LO_NIBBLE_ENCODE = bytes((b & 15) | ((~b << 4) & 240) for b in range(256))
+IS_VALID_ENCODED = bytes(1 if (~(((b << 4) & 240) | ((b >> 4) & 15))) & 0xFF == b else 0 for b in range(256))
+
+
 def is_valid_node_address(address):
     return FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS
 
 
 def is_valid_slave_address(address):
-    return is_valid_node_address(address) and address != MASTER_ADDRESS
+    return FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS and address != MASTER_ADDRESS
 
 
 # * -- Utility functions (see simple485_remastered/utils.py) --
@@ -67,11 +92,57 @@ def get_milliseconds():
     return utime.ticks_ms()
 
 
+@micropython.viper
+def xor_checksum(buffer: ptr8, length: int, seed: int) -> int:
+    checksum = seed
+    for i in range(length):
+        checksum ^= buffer[i]
+    return checksum
+
+
+# Compact the backing list only after this many items have been consumed from its head
+FIFO_COMPACT_THRESHOLD = const(16)
+
+
+class Fifo:
+    # list.pop(0) shifts every remaining item, so consumed items are skipped with a head index instead.
+    # collections.deque is not used because it cannot be peeked on every MicroPython port.
+    def __init__(self):
+        self._items = []
+        self._head = 0
+
+    def __len__(self):
+        return len(self._items) - self._head
+
+    def append(self, item):
+        self._items.append(item)
+
+    def peek(self):
+        return self._items[self._head]
+
+    def popleft(self):
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head += 1
+
+        if self._head == len(self._items):
+            self._items = []
+            self._head = 0
+        elif self._head >= FIFO_COMPACT_THRESHOLD:
+            del self._items[: self._head]
+            self._head = 0
+
+        return item
+
+
 # * -- Model definitions (see simple485_remastered/models.py) --
 
 
 class ReceivingMessage:
     def __init__(self, timestamp=None):
+        self.reset(timestamp)
+
+    def reset(self, timestamp=None):
         self.timestamp = timestamp
         self.last_byte_timestamp = timestamp
         self.dst_address = None
@@ -81,7 +152,7 @@ class ReceivingMessage:
         self.crc = None
         self.is_first_nibble = True
         self.incoming = 0
-        self.payload_buffer = b""
+        self.payload_len = 0
 
 
 class ReceivedMessage:
@@ -125,13 +196,34 @@ class Simple485Remastered:
         transmit_mode_pin,
         transceiver_toggle_time_ms=DEFAULT_TRANSCEIVER_TOGGLE_TIME_MS,
         log_level=logging.INFO,
+        zero_copy_payloads=False,
     ):
         self._logger = logging.getLogger(self.__class__.__name__, level=log_level)
+        self._debug_enabled = self._logger.getLevel() <= logging.DEBUG
 
         self._interface = interface
         self._interface_baudrate = interface_baudrate
 
-        if not is_valid_node_address(address):
+        # Per-byte transmission time in microseconds with the safety margin applied (x1.1 after flush, x1.2 without),
+        # rounded up and computed once so the fallback wait is an integer multiply instead of float maths per send
+        self._flush_us_per_byte = (BITS_PER_BYTE * 1_100_000 + interface_baudrate - 1) // interface_baudrate
+        self._no_flush_us_per_byte = (BITS_PER_BYTE * 1_200_000 + interface_baudrate - 1) // interface_baudrate
+
+        # The interface capabilities don't change, so pick the transmission wait strategy once
+        if hasattr(interface, "txdone"):
+            self._wait_for_transmission = self._wait_for_txdone
+        elif hasattr(interface, "flush"):
+            self._logger.warning(
+                "Interface does not support txdone. Falling back to using flush with manual timing calculation."
+            )
+            self._wait_for_transmission = self._wait_for_flush
+        else:
+            self._logger.warning(
+                "Interface does not support txdone or flush. Falling back to manual timing calculation with an increased safety margin."
+            )
+            self._wait_for_transmission = self._wait_for_transmission_time
+
+        if not FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS:
             raise ValueError(f"Invalid address: {address}")
 
         self._address = address
@@ -148,9 +240,32 @@ class Simple485Remastered:
         self._last_bus_activity = get_milliseconds()
         self._next_response_delay_ms = LINE_READY_TIME_MS
         self._receiver_state = ReceiverState.IDLE
-        self._receiving_message = None
-        self._received_messages = []
-        self._output_messages = []
+        # Reused for every incoming frame instead of allocating a new one per packet
+        self._receiving_message = ReceivingMessage()
+        # Incoming payloads are decoded into the current buffer. With zero-copy payloads enabled, a delivered message
+        # keeps a memoryview into its buffer until it is read, and reception moves on to the next buffer of the pool.
+        # With a single buffer the payload is always copied out once the frame is complete.
+        self._rx_buffers = tuple(
+            bytearray(MAX_MESSAGE_LEN) for _ in range(RX_BUFFER_POOL_SIZE if zero_copy_payloads else 1)
+        )
+        self._rx_buffer_index = 0
+        self._rx_buffer = self._rx_buffers[0]
+        self._rx_buffers_in_use = 0
+        self._received_messages = Fifo()
+        self._output_messages = Fifo()
+
+        # Indexed by ReceiverState, so dispatching a byte is a single tuple lookup instead of an if/elif ladder
+        self._state_handlers = (
+            self._handle_idle,
+            self._handle_soh_received,
+            self._handle_dest_address_received,
+            self._handle_src_address_received,
+            self._handle_transaction_id_received,
+            self._handle_message_len_received,
+            self._handle_stx_received,
+            self._handle_etx_received,
+            self._handle_crc_ok,
+        )
 
         self._logger.debug(f"Initialized {self.__class__.__name__} with address {self._address}")
 
@@ -161,7 +276,7 @@ class Simple485Remastered:
         return self._address
 
     def set_address(self, address):
-        if not is_valid_node_address(address):
+        if not FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS:
             raise ValueError(f"Invalid address: {address}")
 
         self._logger.info(f"Changing address from {self._address} to {address}")
@@ -172,8 +287,26 @@ class Simple485Remastered:
         utime.sleep_ms(self._transceiver_toggle_time_ms)
 
     def _disable_transmit_mode(self):
+        # No settle time needed here: the transmission wait has already confirmed the last bit left the UART,
+        # and the transceiver's receiver re-enables within microseconds
         self._transmit_mode_pin.off()
-        utime.sleep_ms(self._transceiver_toggle_time_ms)
+
+    def _wait_for_txdone(self, message_to_send):
+        while not self._interface.txdone():
+            utime.sleep_us(10)
+
+    def _wait_for_flush(self, message_to_send):
+        self._interface.flush()
+        self._sleep_for_transmission_time(len(message_to_send) * self._flush_us_per_byte)
+
+    def _wait_for_transmission_time(self, message_to_send):
+        self._sleep_for_transmission_time(len(message_to_send) * self._no_flush_us_per_byte)
+
+    def _sleep_for_transmission_time(self, transmission_time_us):
+        if self._debug_enabled:
+            self._logger.debug(f"Message transmission time: {transmission_time_us} us")
+
+        utime.sleep_us(transmission_time_us)
 
     def loop(self):
         self._receive()
@@ -185,13 +318,15 @@ class Simple485Remastered:
         ):
             self._logger.warning("Inter-byte timeout, resetting receiver state.")
             self._receiver_state = ReceiverState.IDLE
-            self._receiving_message = None
+            self._receiving_message.reset()
 
     def pending_send(self):
-        self._logger.debug(f"Pending send: {len(self._output_messages)}")
+        if self._debug_enabled:
+            self._logger.debug(f"Pending send: {len(self._output_messages)}")
 
         return len(self._output_messages) > 0
 
+    @micropython.native
     def send_message(self, dst_address, payload, transaction_id=0):
         message_len = len(payload)
 
@@ -201,27 +336,30 @@ class Simple485Remastered:
         if message_len > MAX_MESSAGE_LEN:
             raise ValueError(f"Message length exceeds maximum of {MAX_MESSAGE_LEN}.")
 
-        text_buffer = (
-            ControlSequence.LF * 3
-            + ControlSequence.SOH
-            + bytes([dst_address])
-            + bytes([self._address])
-            + bytes([transaction_id])
-            + bytes([message_len])
-            + ControlSequence.STX
-        )
-        crc = self._address ^ dst_address ^ message_len
-        for i in range(message_len):
-            crc ^= payload[i]
-            byte = payload[i] & 240
-            byte = byte | (~(byte >> 4) & 15)
-            text_buffer += bytes([byte])
-            byte = payload[i] & 15
-            byte = byte | ((~byte << 4) & 240)
-            text_buffer += bytes([byte])
-        text_buffer += ControlSequence.ETX + bytes([crc]) + ControlSequence.EOT + ControlSequence.LF * 2
-
-        if self._logger.getLevel() <= logging.DEBUG:
+        # Preallocate the whole frame so the encoding loop writes by index instead of reallocating on every byte
+        text_buffer = bytearray(FRAME_OVERHEAD_LEN + 2 * message_len)
+        text_buffer[0:4] = FRAME_START
+        text_buffer[4] = dst_address
+        text_buffer[5] = self._address
+        text_buffer[6] = transaction_id
+        text_buffer[7] = message_len
+        text_buffer[8] = STX
+
+        i = 9
+        crc = xor_checksum(payload, message_len, self._address ^ dst_address ^ message_len)
+        for j in range(message_len):
+            byte = payload[j]
+            text_buffer[i] = HI_NIBBLE_ENCODE[byte]
+            text_buffer[i + 1] = LO_NIBBLE_ENCODE[byte]
+            i += 2
+
+        text_buffer[i] = ETX
+        text_buffer[i + 1] = crc
+        text_buffer[i + 2] = EOT
+        text_buffer[i + 3] = LF
+        text_buffer[i + 4] = LF
+
+        if self._debug_enabled:
             self._logger.debug(f"Queuing message, buffer: {text_buffer.hex()}, dest_address: {dst_address}")
 
         response_delay_ms = self._next_response_delay_ms
@@ -238,146 +376,191 @@ class Simple485Remastered:
     def read(self):
         if len(self._received_messages) == 0:
             raise ValueError("No messages available to read.")
-        return self._received_messages.pop(0)
 
+        message = self._received_messages.popleft()
+        if isinstance(message.payload, memoryview):
+            # Buffers are handed out and read back in order, so the oldest one in use is released
+            self._rx_buffers_in_use -= 1
+        return message
+
+    def _take_received_payload(self):
+        payload_len = self._receiving_message.payload_len
+
+        # One buffer must always stay free for the next frame, otherwise fall back to copying the payload
+        if self._rx_buffers_in_use < len(self._rx_buffers) - 1:
+            payload = memoryview(self._rx_buffer)[:payload_len]
+            self._rx_buffers_in_use += 1
+            self._rx_buffer_index = (self._rx_buffer_index + 1) % len(self._rx_buffers)
+            self._rx_buffer = self._rx_buffers[self._rx_buffer_index]
+            return payload
+
+        return bytes(memoryview(self._rx_buffer)[:payload_len])
+
+    @micropython.native
     def _process_byte(self, byte):
-        if self._receiver_state == ReceiverState.IDLE:
-            if byte == ControlSequence.SOH:
-                self._receiver_state = ReceiverState.SOH_RECEIVED
+        self._state_handlers[self._receiver_state](byte)
+
+    def _handle_idle(self, byte):
+        if byte == SOH:
+            self._receiver_state = ReceiverState.SOH_RECEIVED
 
-                self._receiving_message = ReceivingMessage(timestamp=get_milliseconds())
+            self._receiving_message.reset(timestamp=get_milliseconds())
 
-        elif self._receiver_state == ReceiverState.SOH_RECEIVED:
-            self._receiving_message.dst_address = byte[0]
-            self._receiver_state = ReceiverState.DEST_ADDRESS_RECEIVED
+    def _handle_soh_received(self, byte):
+        self._receiving_message.dst_address = byte
+        self._receiver_state = ReceiverState.DEST_ADDRESS_RECEIVED
 
-        elif self._receiver_state == ReceiverState.DEST_ADDRESS_RECEIVED:
-            self._receiving_message.src_address = byte[0]
-            self._receiver_state = ReceiverState.SRC_ADDRESS_RECEIVED
+    def _handle_dest_address_received(self, byte):
+        self._receiving_message.src_address = byte
+        self._receiver_state = ReceiverState.SRC_ADDRESS_RECEIVED
 
-        elif self._receiver_state == ReceiverState.SRC_ADDRESS_RECEIVED:
-            self._receiving_message.transaction_id = byte[0]
-            self._receiver_state = ReceiverState.TRANSACTION_ID_RECEIVED
+    def _handle_src_address_received(self, byte):
+        self._receiving_message.transaction_id = byte
+        self._receiver_state = ReceiverState.TRANSACTION_ID_RECEIVED
 
-        elif self._receiver_state == ReceiverState.TRANSACTION_ID_RECEIVED:
-            self._receiving_message.length = byte[0]
+    def _handle_transaction_id_received(self, byte):
+        self._receiving_message.length = byte
 
-            if not (0 < self._receiving_message.length <= MAX_MESSAGE_LEN):
-                self._logger.warning(f"Received invalid message length of: {self._receiving_message.length}. Dropping.")
-                self._receiver_state = ReceiverState.IDLE # Here we must reset to IDLE because we don't know how to read the rest of the message
-                self._receiving_message = None
+        if not (0 < self._receiving_message.length <= MAX_MESSAGE_LEN):
+            self._logger.warning(f"Received invalid message length of: {self._receiving_message.length}. Dropping.")
+            self._receiver_state = ReceiverState.IDLE # Here we must reset to IDLE because we don't know how to read the rest of the message
+            self._receiving_message.reset()
+        else:
+            self._receiver_state = ReceiverState.MESSAGE_LEN_RECEIVED
+
+    def _handle_message_len_received(self, byte):
+        if byte == STX:
+            self._receiving_message.crc = (
+                self._receiving_message.dst_address
+                ^ self._receiving_message.src_address
+                ^ self._receiving_message.length
+            )
+            self._receiver_state = ReceiverState.STX_RECEIVED
+        else:
+            self._logger.warning("Expected STX, but got other data. Dropping.")
+            self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the state is already corrupted
+            self._receiving_message.reset()
+
+    @micropython.native
+    def _handle_stx_received(self, byte):
+        if IS_VALID_ENCODED[byte]:
+            if self._receiving_message.is_first_nibble:
+                self._receiving_message.incoming = byte & 240
+                self._receiving_message.is_first_nibble = False
             else:
-                self._receiver_state = ReceiverState.MESSAGE_LEN_RECEIVED
-
-        elif self._receiver_state == ReceiverState.MESSAGE_LEN_RECEIVED:
-            if byte == ControlSequence.STX:
-                self._receiving_message.crc = (
-                    self._receiving_message.dst_address
-                    ^ self._receiving_message.src_address
-                    ^ self._receiving_message.length
+                if self._receiving_message.payload_len == self._receiving_message.length:
+                    self._logger.warning("Payload exceeds declared length. Dropping.")
+                    self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
+                    self._receiving_message.reset()
+                    return
+
+                self._receiving_message.is_first_nibble = True
+                self._receiving_message.incoming |= byte & 15
+                self._rx_buffer[self._receiving_message.payload_len] = self._receiving_message.incoming
+                self._receiving_message.payload_len += 1
+            return
+
+        if byte == ETX:
+            if self._receiving_message.payload_len == self._receiving_message.length:
+                self._receiving_message.crc = xor_checksum(
+                    self._rx_buffer, self._receiving_message.payload_len, self._receiving_message.crc
                 )
-                self._receiver_state = ReceiverState.STX_RECEIVED
+                self._receiver_state = ReceiverState.ETX_RECEIVED
             else:
-                self._logger.warning("Expected STX, but got other data. Dropping.")
-                self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the state is already corrupted
-                self._receiving_message = None
-
-        elif self._receiver_state == ReceiverState.STX_RECEIVED:
-            is_valid_encoded_byte = (~(((byte[0] << 4) & 240) | ((byte[0] >> 4) & 15))) & 0xFF == byte[0]
+                self._logger.warning("ETX received but payload length is incorrect. Dropping.")
+                self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
+                self._receiving_message.reset()
+            return
 
-            if is_valid_encoded_byte:
-                if self._receiving_message.is_first_nibble:
-                    self._receiving_message.incoming = byte[0] & 240
-                    self._receiving_message.is_first_nibble = False
-                else:
-                    self._receiving_message.is_first_nibble = True
-                    self._receiving_message.incoming |= byte[0] & 15
-                    self._receiving_message.payload_buffer += bytes([self._receiving_message.incoming])
-                    self._receiving_message.crc ^= self._receiving_message.incoming
-                return
-
-            if byte == ControlSequence.ETX:
-                if len(self._receiving_message.payload_buffer) == self._receiving_message.length:
-                    self._receiver_state = ReceiverState.ETX_RECEIVED
-                else:
-                    self._logger.warning("ETX received but payload length is incorrect. Dropping.")
-                    self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
-                    self._receiving_message = None
-                return
+        self._logger.warning("Invalid data byte. Dropping.")
+        self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
+        self._receiving_message.reset()
 
-            self._logger.warning("Invalid data byte. Dropping.")
+    def _handle_etx_received(self, byte):
+        if byte == self._receiving_message.crc:
+            self._receiver_state = ReceiverState.CRC_OK
+        else:
+            self._logger.warning("CRC mismatch. Dropping.")
             self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
-            self._receiving_message = None
+            self._receiving_message.reset()
 
-        elif self._receiver_state == ReceiverState.ETX_RECEIVED:
-            if byte[0] == self._receiving_message.crc:
-                self._receiver_state = ReceiverState.CRC_OK
-            else:
-                self._logger.warning("CRC mismatch. Dropping.")
-                self._receiver_state = ReceiverState.IDLE # Here resetting to IDLE is the best option because the message itself is corrupted
-                self._receiving_message = None
-
-        elif self._receiver_state == ReceiverState.CRC_OK:
-            if byte == ControlSequence.EOT:
-                is_for_us = (
-                    self._receiving_message.dst_address == self._address
-                    or self._receiving_message.dst_address == BROADCAST_ADDRESS
-                )
-                
-                if is_for_us:
-                    if self._receiving_message.length > LONG_MESSAGE_RESPONSE_DELAY_THRESHOLD:
-                        self._next_response_delay_ms = LONG_MESSAGE_RESPONSE_DELAY_MS
-                    else:
-                        self._next_response_delay_ms = LINE_READY_TIME_MS
-
-                    message = ReceivedMessage(
-                    src_address=self._receiving_message.src_address,
-                    dest_address=self._receiving_message.dst_address,
-                    transaction_id=self._receiving_message.transaction_id,
-                    length=self._receiving_message.length,
-                    payload=self._receiving_message.payload_buffer,
-                    originating_bus=self,
-                    )
-                    self._received_messages.append(message)
-                    self._logger.info(f"Successfully received message: {message}")
+    def _handle_crc_ok(self, byte):
+        if byte == EOT:
+            is_for_us = (
+                self._receiving_message.dst_address == self._address
+                or self._receiving_message.dst_address == BROADCAST_ADDRESS
+            )
+            
+            if is_for_us:
+                if self._receiving_message.length > LONG_MESSAGE_RESPONSE_DELAY_THRESHOLD:
+                    self._next_response_delay_ms = LONG_MESSAGE_RESPONSE_DELAY_MS
                 else:
-                    self._logger.info("Received message for another address. Ignoring.")
+                    self._next_response_delay_ms = LINE_READY_TIME_MS
+
+                message = ReceivedMessage(
+                src_address=self._receiving_message.src_address,
+                dest_address=self._receiving_message.dst_address,
+                transaction_id=self._receiving_message.transaction_id,
+                length=self._receiving_message.length,
+                payload=self._take_received_payload(),
+                originating_bus=self,
+                )
+                self._received_messages.append(message)
+                self._logger.info("Successfully received message: %s", message)
             else:
-                self._logger.warning("Expected EOT. Dropping packet.")
+                self._logger.info("Received message for another address. Ignoring.")
+        else:
+            self._logger.warning("Expected EOT. Dropping packet.")
 
-            self._receiver_state = ReceiverState.IDLE
-            self._receiving_message = None
+        self._receiver_state = ReceiverState.IDLE
+        self._receiving_message.reset()
 
+    @micropython.native
     def _receive(self):
         pending = self._interface.any()
-        while pending > 0:
-            byte = self._interface.read(1)
+        if not pending:
+            return
+
+        # Drain everything the UART has buffered in one call rather than crossing into the driver per byte
+        data = self._interface.read(pending)
+        if not data:
+            return
 
-            if byte is None or (byte == ControlSequence.NULL and self._receiver_state == ReceiverState.IDLE):
-                pending = self._interface.any()
+        debug_enabled = self._debug_enabled
+        # Resolve the class attribute once instead of per received byte
+        idle_state = ReceiverState.IDLE
+        processed = False
+
+        for byte in data:
+            if byte == NULL and self._receiver_state == idle_state:
                 continue
 
-            self._last_bus_activity = get_milliseconds()
-            if self._logger.getLevel() <= logging.DEBUG:
-                self._logger.debug(f"Received byte: {byte.hex()} in state {self._receiver_state}")
+            if debug_enabled:
+                self._logger.debug(f"Received byte: {byte:02x} in state {self._receiver_state}")
 
             self._process_byte(byte)
-            if self._receiving_message is not None:
-                self._receiving_message.last_byte_timestamp = self._last_bus_activity
-            pending = self._interface.any()
+            processed = True
+
+        if not processed:
+            return
+
+        # A single timestamp per batch is precise enough for the inter-byte timeout
+        self._last_bus_activity = get_milliseconds()
+        if self._receiver_state != ReceiverState.IDLE:
+            self._receiving_message.last_byte_timestamp = self._last_bus_activity
 
     def _transmit(self):
-        if not self._output_messages:
+        if len(self._output_messages) == 0:
             return False
 
-        message_to_send, response_delay_ms = self._output_messages[0]
+        message_to_send, response_delay_ms = self._output_messages.peek()
 
         if utime.ticks_diff(get_milliseconds(), self._last_bus_activity) < response_delay_ms:
-            if self._logger.getLevel() <= logging.DEBUG:
+            if self._debug_enabled:
                 self._logger.debug("Line not ready for transmission, waiting.")
             return False
 
-        if self._logger.getLevel() <= logging.DEBUG:
+        if self._debug_enabled:
             self._logger.debug(f"Attempting to transmit a message, buffer: {message_to_send.hex()}")
 
         error_occurred = False
@@ -385,34 +568,7 @@ class Simple485Remastered:
             self._enable_transmit_mode()
             self._interface.write(message_to_send)
 
-            try:
-                while not self._interface.txdone():
-                    utime.sleep_us(10)
-            except AttributeError:
-                self._logger.warning(
-                    "Interface does not support txdone. Falling back to using flush with manual timing calculation."
-                )
-
-                safety_margin_factor = 1.1
-
-                try:
-                    self._interface.flush()
-                except AttributeError:
-                    self._logger.warning(
-                        "Interface does not support flush. Increasing safety margin factor for manual timing calculation."
-                    )
-                    safety_margin_factor = 1.2
-
-                transmission_time_s = (
-                    (len(message_to_send) * BITS_PER_BYTE) / self._interface_baudrate
-                ) * safety_margin_factor
-
-                transmission_time_us = int(transmission_time_s * 1_000_000)
-
-                if self._logger.getLevel() <= logging.DEBUG:
-                    self._logger.debug(f"Message transmission time: {transmission_time_s} s ({transmission_time_us} us)")
-
-                utime.sleep_us(transmission_time_us)
+            self._wait_for_transmission(message_to_send)
         except OSError as e:
             self._logger.exception(e, f"Serial communication error: {e}. Message not sent.")
             error_occurred = True
@@ -423,7 +579,7 @@ class Simple485Remastered:
             self._disable_transmit_mode()
 
         self._last_bus_activity = get_milliseconds()
-        self._output_messages.pop(0)
+        self._output_messages.popleft()
 
         if not error_occurred:
             self._logger.info("Message sent successfully, buffer: %s", message_to_send.hex())
@@ -446,10 +602,11 @@ class Node:
         transmit_mode_pin,
         transceiver_toggle_time_ms=DEFAULT_TRANSCEIVER_TOGGLE_TIME_MS,
         log_level=logging.INFO,
+        zero_copy_payloads=False,
     ):
         self._logger = logging.getLogger(self.__class__.__name__, level=log_level)
 
-        if not is_valid_node_address(address):
+        if not FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS:
             raise ValueError(f"Invalid address for Node: {address}")
 
         self._address = address
@@ -460,6 +617,7 @@ class Node:
             transmit_mode_pin=transmit_mode_pin,
             transceiver_toggle_time_ms=transceiver_toggle_time_ms,
             log_level=log_level,
+            zero_copy_payloads=zero_copy_payloads,
         )
 
         self._logger.debug(f"Initialized {self.__class__.__name__} with address {self._address}")
@@ -470,12 +628,20 @@ class Node:
         while self._bus.available() > 0:
             try:
                 message = self._bus.read()
-                self._logger.info(f"Received a message: {message}")
+                self._logger.info("Received a message: %s", message)
 
                 self._handle_incoming_message(message)
             except Exception as e:
                 self._logger.exception(e, f"Error while handling incoming message: {e}")
 
+    def _pending_send(self):
+        return self._bus.pending_send()
+
+    def _set_address(self, address):
+        # Only updates the address used for filtering and sending; the interface and receiver state are left untouched
+        self._bus.set_address(address)
+        self._address = address
+
     def _handle_incoming_message(self, message, elapsed_ms=None):
         raise NotImplementedError
 
@@ -493,8 +659,9 @@ class Slave(Node):
         transmit_mode_pin,
         transceiver_toggle_time_ms=DEFAULT_TRANSCEIVER_TOGGLE_TIME_MS,
         log_level=logging.INFO,
+        zero_copy_payloads=False,
     ):
-        if not is_valid_slave_address(address):
+        if not (FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS and address != MASTER_ADDRESS):
             raise ValueError(
                 f"Invalid address for Slave: {address}. Address must be between {FIRST_NODE_ADDRESS + 1} and {LAST_NODE_ADDRESS}."
             )
@@ -506,11 +673,20 @@ class Slave(Node):
             transmit_mode_pin=transmit_mode_pin,
             transceiver_toggle_time_ms=transceiver_toggle_time_ms,
             log_level=log_level,
+            zero_copy_payloads=zero_copy_payloads,
         )
 
     def loop(self):
         self._loop()
 
+    def _set_address(self, address):
+        if not (FIRST_NODE_ADDRESS <= address <= LAST_NODE_ADDRESS and address != MASTER_ADDRESS):
+            raise ValueError(
+                f"Invalid address for Slave: {address}. Address must be between {FIRST_NODE_ADDRESS + 1} and {LAST_NODE_ADDRESS}."
+            )
+
+        super(Slave, self)._set_address(address)
+
     def _handle_incoming_message(self, message, elapsed_ms=None):
         if message.src_address != MASTER_ADDRESS:
             self._logger.warning(
@@ -1,7 +1,7 @@
 """A test script for a Slave node designed to work with the address range master.
 
 This script behaves uniquely: instead of maintaining a single, fixed address,
-it simulates an entire bus of slaves. It starts by listening on `FIRST_ADDRESS`.
+it simulates an entire bus of slaves. It starts by listening on `_FIRST_ADDRESS`.
 When it receives a "ping" from the master, it responds with "pong" and then
 dynamically changes its own address to the next one in the sequence, ready to
 receive the master's next ping.
@@ -9,7 +9,7 @@ receive the master's next ping.
 This allows a single slave device to validate the master's ability to communicate
 with all addresses in a given range.
 
-It also includes a `SIMULATED_FAILURES_COUNT` option to intentionally ignore
+It also includes a `_SIMULATED_FAILURES_COUNT` option to intentionally ignore
 pings, which is useful for testing the master's timeout and retry mechanisms.
 
 Usage:
@@ -23,8 +23,9 @@ Usage:
 # ------------------------------------------------------------------------------
 
 import logging
-import time
+import utime
 from machine import UART, Pin
+from micropython import const
 
 from simple485_remastered_micro import Slave, ReceivedMessage
 
@@ -32,19 +33,19 @@ from simple485_remastered_micro import Slave, ReceivedMessage
 logger = logging.getLogger(__name__, level=logging.DEBUG)
 
 # -- Transceiver Configuration ---
-UART_ID = 0
-BAUDRATE = 9600
-UART_TX_PIN = 16
-UART_RX_PIN = 17
+_UART_ID = const(0)
+_BAUDRATE = const(9600)
+_UART_TX_PIN = const(16)
+_UART_RX_PIN = const(17)
 TRANSCEIVER_PIN = None
 
 # --- Test Configuration ---
-FIRST_ADDRESS = 1
-LAST_ADDRESS = 254
+_FIRST_ADDRESS = const(1)
+_LAST_ADDRESS = const(254)
 # Set to > 0 to test the Master's timeout/retry logic. The slave will ignore
 #  these many pings before starting to respond normally again.
-SIMULATED_FAILURES_COUNT = 0
-ITERATIONS = 1
+_SIMULATED_FAILURES_COUNT = const(0)
+_ITERATIONS = const(1)
 
 
 class AddrTestSlave(Slave):
@@ -56,13 +57,13 @@ class AddrTestSlave(Slave):
 
     def __init__(self):
         """Initializes the Slave and the serial port for communication."""
-        interface = UART(UART_ID, baudrate=BAUDRATE, tx=Pin(UART_TX_PIN), rx=Pin(UART_RX_PIN))
+        interface = UART(_UART_ID, baudrate=_BAUDRATE, tx=Pin(_UART_TX_PIN), rx=Pin(_UART_RX_PIN))
 
-        self._current_address = FIRST_ADDRESS
+        self._current_address = _FIRST_ADDRESS
         super().__init__(interface=interface, address=self._current_address)
 
         self._ping_received = False
-        self._simulated_failures_count = SIMULATED_FAILURES_COUNT
+        self._simulated_failures_count = _SIMULATED_FAILURES_COUNT
 
     def _handle_unicast_message(self, message: ReceivedMessage) -> None:
         """Routes a unicast message to a handler based on its payload."""
@@ -112,7 +113,7 @@ class AddrTestSlave(Slave):
 
         self._on_ping_registered()
         # Reset failure counter for the next address
-        self._simulated_failures_count = SIMULATED_FAILURES_COUNT
+        self._simulated_failures_count = _SIMULATED_FAILURES_COUNT
 
     def run(self):
         """Runs the main test loop for the slave.
@@ -120,9 +121,9 @@ class AddrTestSlave(Slave):
         It sets its address, then waits in a loop for a ping. After processing
         the ping and ensuring the response is sent, it moves to the next address.
         """
-        for i in range(ITERATIONS):
-            logger.info(f"--- Starting Iteration {i + 1}/{ITERATIONS} ---")
-            while self._current_address <= LAST_ADDRESS:
+        for i in range(_ITERATIONS):
+            logger.info(f"--- Starting Iteration {i + 1}/{_ITERATIONS} ---")
+            while self._current_address <= _LAST_ADDRESS:
                 self._ping_received = False
                 self._set_address(self._current_address)
                 logger.info(f"Now listening on address: {self._current_address}")
@@ -131,13 +132,13 @@ class AddrTestSlave(Slave):
                 # has been fully sent before changing the address.
                 while not self._ping_received or self._pending_send():
                     self._loop()  # Process bus I/O
-                    time.sleep(0.0001)
+                    utime.sleep_us(100)
 
             logger.info(
-                f"Tested {self._current_address - FIRST_ADDRESS} addresses from range "
-                f"{FIRST_ADDRESS} - {self._current_address - 1}."
+                f"Tested {self._current_address - _FIRST_ADDRESS} addresses from range "
+                f"{_FIRST_ADDRESS} - {self._current_address - 1}."
             )
-            self._current_address = FIRST_ADDRESS  # Reset for next iteration
+            self._current_address = _FIRST_ADDRESS  # Reset for next iteration
         logger.info("--- Test Complete ---")
 
 
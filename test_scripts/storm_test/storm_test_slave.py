@@ -6,7 +6,7 @@ communication protocol.
 
 Key Behavior:
 - **Dynamic Address Changing: ** Like the address range test slave, this script
-  does not have a fixed address. It starts at `FIRST_ADDRESS` and simulates an
+  does not have a fixed address. It starts at `_FIRST_ADDRESS` and simulates an
   entire bus of slaves by incrementing its own address as the test progresses.
 - **Echo Server: ** For each address it listens on, it expects a series of
   payloads of varying lengths from the master. Its sole job is to "echo" each
@@ -28,26 +28,63 @@ Usage:
 # ------------------------------------------------------------------------------
 
 import logging
-import time
-from machine import UART, Pin
+import micropython
+import uselect
+from machine import UART, Pin, freq, idle
+from micropython import const
 
 from simple485_remastered_micro import Slave, ReceivedMessage
 
-logger = logging.getLogger(__name__, level=logging.DEBUG)
+# Set to 1 to get log output while triaging. Logging goes out over the console and competes with the
+#  test UART for the CPU, so release runs replace the logger with one that drops every call. Being a const,
+#  it also lets the compiler strip the `if _DEBUG:` guarded debug lines entirely.
+_DEBUG = const(0)
+
+
+class _NullLogger:
+    """A stand-in logger that discards every call without formatting anything."""
+
+    def _discard(self, *_args, **_kwargs) -> None:
+        pass
+
+    debug = info = warning = error = exception = _discard
+
+
+if _DEBUG:
+    logger = logging.getLogger(__name__, level=logging.DEBUG)
+else:
+    logger = _NullLogger()
 
 # -- Transceiver Configuration ---
-UART_ID = 0
-BAUDRATE = 9600
-UART_TX_PIN = 16
-UART_RX_PIN = 17
+_UART_ID = const(0)
+_BAUDRATE = const(9600)
+_UART_TX_PIN = const(16)
+_UART_RX_PIN = const(17)
+# Size of the driver's IRQ-fed RX ring buffer. It must hold at least one longest frame (14 + 2 * 255 bytes),
+# so bytes are never lost while the Python loop is busy, e.g. echoing the previous payload.
+_UART_RX_BUFFER_SIZE = const(1024)
 TRANSCEIVER_PIN = None
 
 # --- Test Configuration ---
-FIRST_ADDRESS = 1
-LAST_ADDRESS = 254
-PAYLOAD_LENGTH_RANGE = (1, 256)
-SIMULATED_FAILURES_COUNT = 0
-ITERATIONS = 1
+_FIRST_ADDRESS = const(1)
+_LAST_ADDRESS = const(254)
+# Payload lengths from _PAYLOAD_LENGTH_START up to, but not including, _PAYLOAD_LENGTH_STOP
+_PAYLOAD_LENGTH_START = const(1)
+_PAYLOAD_LENGTH_STOP = const(256)
+_SIMULATED_FAILURES_COUNT = const(0)  # Stored in a single byte, so it must not exceed 255
+_ITERATIONS = const(1)
+# CPU clock to run the test at, restored afterwards, e.g. 240_000_000 on ESP32. 0 keeps the default clock.
+#  Only raise it on ports that keep the UART baud rate stable across frequency changes.
+_TEST_CPU_FREQ_HZ = const(0)
+
+# Indices into StormTestSlave._flags
+_PAYLOAD_RECEIVED = const(0)
+_SIMULATED_FAILURES_LEFT = const(1)
+_RX_PENDING = const(2)
+_RESPONSE_QUEUED = const(3)
+
+# Upper bound for a single wait on the UART, so a queued response is still sent once its delay has passed
+_POLL_TIMEOUT_MS = const(1)
 
 
 class StormTestSlave(Slave):
@@ -59,79 +96,142 @@ class StormTestSlave(Slave):
 
     def __init__(self):
         """Initializes the Slave and the serial port for communication."""
-        interface = UART(UART_ID, baudrate=BAUDRATE, tx=Pin(UART_TX_PIN), rx=Pin(UART_RX_PIN))
-
-        self._current_address = FIRST_ADDRESS
-        super().__init__(interface=interface, address=self._current_address)
-
-        self._payload_received = False
-        self._simulated_failures_count = SIMULATED_FAILURES_COUNT
-
-    def _handle_unicast_message(self, message: ReceivedMessage) -> None:
-        """Dispatches any unicast message to the main handler."""
-        self.on_unicast_message(message)
-
-    def _handle_broadcast_message(self, message: ReceivedMessage) -> None:
-        """Dispatches any broadcast message to the main handler."""
-        self.on_broadcast_message(message)
-
+        interface = UART(
+            _UART_ID, baudrate=_BAUDRATE, tx=Pin(_UART_TX_PIN), rx=Pin(_UART_RX_PIN), rxbuf=_UART_RX_BUFFER_SIZE
+        )
+
+        self._current_address = _FIRST_ADDRESS
+        # Payloads arrive as memoryviews into the bus's RX buffers, so echoing one back encodes it straight from there
+        super().__init__(
+            interface=interface,
+            address=self._current_address,
+            log_level=logging.DEBUG if _DEBUG else logging.WARNING,
+            zero_copy_payloads=True,
+        )
+
+        # State shared between the handlers, the RX IRQ and the wait loop, kept in preallocated single-byte slots:
+        # byte writes are atomic and don't allocate, which is required for code running from an IRQ
+        self._flags = bytearray(4)
+        self._flags[_SIMULATED_FAILURES_LEFT] = _SIMULATED_FAILURES_COUNT
+
+        # Set from the UART RX IRQ, which also wakes the wait loop from idle() as soon as data arrives.
+        # Ports without UART.irq or IRQ_RXIDLE still wake up on the next system tick.
+        try:
+            interface.irq(handler=self._on_rx_irq, trigger=UART.IRQ_RXIDLE)
+        except (AttributeError, ValueError):
+            logger.warning("UART RX IRQ not supported on this port. Falling back to polling.")
+
+        # Wait for RX through the stream poller where the port supports polling a UART, otherwise use machine.idle()
+        self._poller = None
+        try:
+            poller = uselect.poll()
+            poller.register(interface, uselect.POLLIN)
+            poller.poll(0)
+            self._poller = poller
+        except (AttributeError, OSError, TypeError):
+            logger.warning("UART is not pollable on this port. Falling back to machine.idle().")
+
+    def _on_rx_irq(self, _uart) -> None:
+        """UART RX IRQ handler, kept minimal: it only flags that data is waiting."""
+        self._flags[_RX_PENDING] = 1
+
+    @micropython.native
     def _on_payload_registered(self) -> None:
         """Helper method to signal that a payload has been processed."""
-        self._payload_received = True
+        self._flags[_PAYLOAD_RECEIVED] = 1
 
-    def on_broadcast_message(self, _message: ReceivedMessage):
+    @micropython.native
+    def _handle_broadcast_message(self, _message: ReceivedMessage) -> None:
         """Handles a broadcast message by logging it and not responding."""
         logger.info("Received broadcast message. Not responding.")
         self._on_payload_registered()
 
-    def on_unicast_message(self, message: ReceivedMessage):
+    @micropython.native
+    def _handle_unicast_message(self, message: ReceivedMessage) -> None:
         """The core "echo" logic of the slave.
 
         It takes the payload from the incoming message and immediately sends it
         back to the master using the `message.respond()` helper. It can also
         simulate failures.
         """
-        if self._simulated_failures_count > 0:
-            self._simulated_failures_count -= 1
+        if self._flags[_SIMULATED_FAILURES_LEFT] > 0:
+            self._flags[_SIMULATED_FAILURES_LEFT] -= 1
             logger.warning("Simulating a failure by not responding.")
             self._on_payload_registered()
             return
 
         message.respond(message=message.payload)
-        logger.debug(f"Received payload of length {len(message.payload)}, echoed it back.")
+        self._flags[_RESPONSE_QUEUED] = 1
+        if _DEBUG:
+            logger.debug("Received payload of length %d, echoed it back.", len(message.payload))
 
         self._on_payload_registered()
         # Reset failure counter for the next payload
-        self._simulated_failures_count = SIMULATED_FAILURES_COUNT
+        self._flags[_SIMULATED_FAILURES_LEFT] = _SIMULATED_FAILURES_COUNT
 
     def run(self):
         """Runs the main test loop for the slave.
 
         It iterates through addresses and payload lengths, waiting for each
-        message from the master and echoing it back.
+        message from the master and echoing it back. If `_TEST_CPU_FREQ_HZ` is
+        set, the CPU runs at that clock for the duration of the test.
         """
-        for i in range(ITERATIONS):
-            logger.info(f"--- Starting Iteration {i + 1}/{ITERATIONS} ---")
-            while self._current_address <= LAST_ADDRESS:
-                self._set_address(self._current_address)
-                logger.info(f"--- Now listening on address: {self._current_address} ---")
-                for payload_length in range(*PAYLOAD_LENGTH_RANGE):
-                    self._payload_received = False
-                    logger.debug(f"Waiting for payload of length {payload_length}...")
+        if not _TEST_CPU_FREQ_HZ:
+            self._run_test()
+            return
+
+        default_freq = freq()
+        freq(_TEST_CPU_FREQ_HZ)
+        try:
+            self._run_test()
+        finally:
+            freq(default_freq)
+
+    def _run_test(self):
+        """Iterates through the addresses and payload lengths, echoing every payload."""
+        # Built once and reused for every address instead of allocating a new range object each time
+        payload_lengths = range(_PAYLOAD_LENGTH_START, _PAYLOAD_LENGTH_STOP)
+        # Resolve the bound methods and the flag buffer once instead of on every pass of the wait loop
+        loop = self._loop
+        pending_send = self._pending_send
+        flags = self._flags
+        # ipoll() reuses the poller's result instead of allocating a new list on every call
+        ipoll = self._poller.ipoll if self._poller is not None else None
+
+        for i in range(_ITERATIONS):
+            logger.info("--- Starting Iteration %d/%d ---", i + 1, _ITERATIONS)
+            for address in range(_FIRST_ADDRESS, _LAST_ADDRESS + 1):
+                self._current_address = address
+                self._set_address(address)
+                logger.info("--- Now listening on address: %d ---", address)
+                for payload_length in payload_lengths:
+                    flags[_PAYLOAD_RECEIVED] = 0
+                    flags[_RESPONSE_QUEUED] = 0
+                    if _DEBUG:
+                        logger.debug("Waiting for payload of length %d...", payload_length)
 
                     # Wait until a payload is received AND the echo response is fully sent.
                     # This prevents a race condition where the slave might expect the
                     # next payload before the master has received the previous response.
-                    while not self._payload_received or self._pending_send():
-                        self._loop()
-                        time.sleep(0.0001)
-                self._current_address += 1
+                    # The bus is only asked about pending sends when an echo was actually queued, so broadcasts
+                    # and simulated failures finish the wait on the flag alone.
+                    while not flags[_PAYLOAD_RECEIVED] or (flags[_RESPONSE_QUEUED] and pending_send()):
+                        loop()
+                        # Block until the UART is readable, or park the core until the next interrupt (UART RX IRQ
+                        # or system tick), unless the RX IRQ already fired during the last pass and data is waiting
+                        if flags[_RX_PENDING]:
+                            flags[_RX_PENDING] = 0
+                        elif ipoll is not None:
+                            ipoll(_POLL_TIMEOUT_MS)
+                        else:
+                            idle()
 
             logger.info(
-                f"Successfully tested {self._current_address - FIRST_ADDRESS} addresses from range "
-                f"{FIRST_ADDRESS} - {self._current_address - 1}."
+                "Successfully tested %d addresses from range %d - %d.",
+                _LAST_ADDRESS - _FIRST_ADDRESS + 1,
+                _FIRST_ADDRESS,
+                _LAST_ADDRESS,
             )
-            self._current_address = FIRST_ADDRESS  # Reset for next iteration
         logger.info("--- Storm Test Complete ---")
 
 